@@ -283,19 +283,28 @@ class LocalRelation(LogicalPlan):
 
         assert schema is None or isinstance(schema, str)
 
-        self._table = table
+        # Serialize the table once here instead of every time the plan is built, and do not
+        # keep the table itself alive in the plan.
+        self._data: Optional[bytes] = None
+        if table is not None:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                batches = table.to_batches()
+                if len(batches) == 0:
+                    # The server reads the schema from the first batch, so an empty table
+                    # still has to write one.
+                    batches = [pa.RecordBatch.from_pylist([], schema=table.schema)]
+                for b in batches:
+                    writer.write_batch(b)
+            self._data = sink.getvalue().to_pybytes()
 
         self._schema = schema
 
     def plan(self, session: "SparkConnectClient") -> proto.Relation:
         plan = proto.Relation()
 
-        if self._table is not None:
-            sink = pa.BufferOutputStream()
-            with pa.ipc.new_stream(sink, self._table.schema) as writer:
-                for b in self._table.to_batches():
-                    writer.write_batch(b)
-            plan.local_relation.data = sink.getvalue().to_pybytes()
+        if self._data is not None:
+            plan.local_relation.data = self._data
 
         if self._schema is not None:
             plan.local_relation.schema = self._schema
@@ -918,10 +927,10 @@ class Range(LogicalPlan):
         num_partitions: Optional[int] = None,
     ) -> None:
         super().__init__(None)
-        self._start = start
-        self._end = end
-        self._step = step
-        self._num_partitions = num_partitions
+        self._start = int(start)
+        self._end = int(end)
+        self._step = int(step)
+        self._num_partitions = None if num_partitions is None else int(num_partitions)
 
     def plan(self, session: "SparkConnectClient") -> proto.Relation:
         rel = proto.Relation()
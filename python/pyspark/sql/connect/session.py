@@ -16,10 +16,10 @@
 #
 import os
 import warnings
-from distutils.version import LooseVersion
 from threading import RLock
 from collections.abc import Sized
-from functools import reduce
+from functools import partial, reduce
+from itertools import islice, zip_longest
 
 import numpy as np
 import pandas as pd
@@ -34,6 +34,7 @@ from pyspark.sql.types import (
     _merge_type,
     Row,
     DataType,
+    StructField,
     StructType,
     AtomicType,
 )
@@ -41,15 +42,17 @@ from pyspark.sql.utils import to_str
 
 from pyspark.sql.connect.client import SparkConnectClient
 from pyspark.sql.connect.dataframe import DataFrame
-from pyspark.sql.connect.plan import SQL, Range, LocalRelation
+from pyspark.sql.connect.plan import SQL, Range, LocalRelation, Read
 from pyspark.sql.connect.readwriter import DataFrameReader
 
 from typing import (
     Optional,
     Any,
+    Callable,
     Union,
     Dict,
     List,
+    Set,
     Tuple,
     cast,
     overload,
@@ -136,7 +139,7 @@ class SparkSession:
         self._client = SparkConnectClient(connectionString)
 
     def table(self, tableName: str) -> DataFrame:
-        return self.read.table(tableName)
+        return DataFrame.withPlan(Read(tableName), self)
 
     table.__doc__ = PySparkSession.table.__doc__
 
@@ -163,26 +166,47 @@ class SparkSession:
         infer_dict_as_struct = False
         infer_array_from_first_element = False
         prefer_timestamp_ntz = False
-        schema = reduce(
-            _merge_type,
-            (
-                _infer_schema(
-                    row,
-                    names,
-                    infer_dict_as_struct=infer_dict_as_struct,
-                    infer_array_from_first_element=infer_array_from_first_element,
-                    prefer_timestamp_ntz=prefer_timestamp_ntz,
-                )
-                for row in data
-            ),
+        # Merge the inferred types field by field into a single mapping instead of
+        # reducing over the per-row schemas, which allocates a new StructType per row.
+        # The fields whose type still contains a NullType are tracked along the way, so
+        # the merged schema does not have to be walked again afterwards.
+        infer = partial(
+            _infer_schema,
+            names=names,
+            infer_dict_as_struct=infer_dict_as_struct,
+            infer_array_from_first_element=infer_array_from_first_element,
+            prefer_timestamp_ntz=prefer_timestamp_ntz,
         )
-        if _has_nulltype(schema):
+        fields: Dict[str, DataType] = {}
+        null_fields: Set[str] = set()
+        for row in data:
+            row_schema = infer(row)
+            if len(set(row_schema.names)) != len(row_schema.names):
+                # Rows with duplicate field names, e.g., collected from a self join, cannot
+                # be merged by name. Merge the whole schemas so that no field is dropped.
+                schema = reduce(_merge_type, (infer(row) for row in data))
+                if _has_nulltype(schema):
+                    raise ValueError("Some of types cannot be determined after inferring")
+                return schema
+            for field in row_schema.fields:
+                name, dataType = field.name, field.dataType
+                current = fields.get(name)
+                if current is not None:
+                    if current is dataType or current == dataType:
+                        continue
+                    dataType = _merge_type(current, dataType, name="field %s" % name)
+                fields[name] = dataType
+                if _has_nulltype(dataType):
+                    null_fields.add(name)
+                else:
+                    null_fields.discard(name)
+        if null_fields:
             raise ValueError("Some of types cannot be determined after inferring")
-        return schema
+        return StructType([StructField(name, dataType) for name, dataType in fields.items()])
 
     def createDataFrame(
         self,
-        data: Union["pd.DataFrame", "np.ndarray", Iterable[Any]],
+        data: Union["pd.DataFrame", "np.ndarray", "pa.Table", "pa.RecordBatch", Iterable[Any]],
         schema: Optional[Union[AtomicType, StructType, str, List[str], Tuple[str, ...]]] = None,
     ) -> "DataFrame":
         assert data is not None
@@ -200,10 +224,12 @@ class SparkSession:
             _schema_str = schema
 
         elif isinstance(schema, (list, tuple)):
-            # Must re-encode any unicode strings to be consistent with StructField names
-            _cols = [x.encode("utf-8") if not isinstance(x, str) else x for x in schema]
+            _cols = list(schema)
 
-        if isinstance(data, Sized) and len(data) == 0:
+        # Arrow data carries its own schema, so it is converted as is even when empty.
+        is_arrow_data = isinstance(data, (pa.Table, pa.RecordBatch))
+
+        if isinstance(data, Sized) and not is_arrow_data and len(data) == 0:
             if _schema is not None:
                 return DataFrame.withPlan(LocalRelation(table=None, schema=_schema.json()), self)
             elif _schema_str is not None:
@@ -214,48 +240,33 @@ class SparkSession:
         _table: Optional[pa.Table] = None
         _inferred_schema: Optional[StructType] = None
 
-        if isinstance(data, pd.DataFrame):
-            from pandas.api.types import (  # type: ignore[attr-defined]
-                is_datetime64_dtype,
-                is_datetime64tz_dtype,
-            )
-            from pyspark.sql.pandas.types import (
-                _check_series_convert_timestamps_internal,
-                _get_local_timezone,
-            )
-
-            # First, check if we need to create a copy of the input data to adjust
-            # the timestamps.
-            input_data = data
-            has_timestamp_data = any(
-                [is_datetime64_dtype(data[c]) or is_datetime64tz_dtype(data[c]) for c in data]
-            )
-            if has_timestamp_data:
-                input_data = data.copy()
-                # We need double conversions for the truncation, first truncate to microseconds.
-                for col in input_data:
-                    if is_datetime64tz_dtype(input_data[col].dtype):
-                        input_data[col] = _check_series_convert_timestamps_internal(
-                            input_data[col], _get_local_timezone()
-                        ).astype("datetime64[us, UTC]")
-                    elif is_datetime64_dtype(input_data[col].dtype):
-                        input_data[col] = input_data[col].astype("datetime64[us]")
-
-                # Create a new schema and change the types to the truncated microseconds.
-                pd_schema = pa.Schema.from_pandas(input_data)
-                new_schema = pa.schema([])
-                for x in range(len(pd_schema.types)):
-                    f = pd_schema.field(x)
-                    # TODO(SPARK-42027) Add support for struct types.
-                    if isinstance(f.type, pa.TimestampType) and f.type.unit == "ns":
-                        tmp = f.with_type(pa.timestamp("us"))
-                        new_schema = new_schema.append(tmp)
-                    else:
-                        new_schema = new_schema.append(f)
-                new_schema = new_schema.with_metadata(pd_schema.metadata)
-                _table = pa.Table.from_pandas(input_data, schema=new_schema)
+        if is_arrow_data or isinstance(data, pd.DataFrame):
+            if isinstance(data, pa.Table):
+                _table = data
+            elif isinstance(data, pa.RecordBatch):
+                _table = pa.Table.from_batches([data])
             else:
-                _table = pa.Table.from_pandas(data)
+                _table = pa.Table.from_pandas(data, preserve_index=False, safe=False)
+
+            # The server only accepts microsecond timestamps, so convert the other units to
+            # microseconds, and normalize the timezone-aware ones to UTC. Casting on the Arrow
+            # side avoids copying the pandas DataFrame. Only the nanoseconds are truncated
+            # unsafely; the coarser units are cast safely so that an overflow is not ignored.
+            # TODO(SPARK-42027) Add support for struct types.
+            for units, safe in [(("ns",), False), (("s", "ms"), True)]:
+                if any(
+                    isinstance(t, pa.TimestampType) and t.unit in units for t in _table.schema.types
+                ):
+                    new_schema = pa.schema(
+                        [
+                            f.with_type(pa.timestamp("us", tz=None if f.type.tz is None else "UTC"))
+                            if isinstance(f.type, pa.TimestampType) and f.type.unit in units
+                            else f
+                            for f in _table.schema
+                        ],
+                        metadata=_table.schema.metadata,
+                    )
+                    _table = _table.cast(new_schema, safe=safe)
 
         elif isinstance(data, np.ndarray):
             if data.ndim not in [1, 2]:
@@ -282,19 +293,20 @@ class SparkSession:
                         f"new values have {len(_cols)} elements"
                     )
 
-                _table = pa.Table.from_arrays(
-                    [pa.array(data[::, i]) for i in range(0, data.shape[1])], _cols
-                )
+                # Hand each column to Arrow as a contiguous 1-D buffer so that numeric
+                # columns can be wrapped without a per-column copy.
+                if data.flags["F_CONTIGUOUS"]:
+                    columns = [data[:, i] for i in range(0, data.shape[1])]
+                else:
+                    columns = list(np.ascontiguousarray(data.T))
+
+                _table = pa.Table.from_arrays([pa.array(c) for c in columns], _cols)
 
         else:
-            _data = list(data)
+            # Only materialize the input when it is not a list already, e.g., a generator.
+            _data = data if isinstance(data, list) else list(data)
 
             if _schema is None and isinstance(_data[0], (Row, dict)):
-                if isinstance(_data[0], dict):
-                    # Sort the data to respect inferred schema.
-                    # For dictionaries, we sort the schema in alphabetical order.
-                    _data = [dict(sorted(d.items())) for d in _data]
-
                 _inferred_schema = self._inferSchemaFromList(_data, _cols)
                 if _cols is not None:
                     for i, name in enumerate(_cols):
@@ -314,15 +326,14 @@ class SparkSession:
                 else:
                     _cols = ["value"]
 
-            if isinstance(_data[0], Row):
-                _table = pa.Table.from_pylist([row.asDict(recursive=True) for row in _data])
-            elif isinstance(_data[0], dict):
-                _table = pa.Table.from_pylist(_data)
-            elif isinstance(_data[0], (list, tuple)):
-                _table = pa.Table.from_pylist([dict(zip(_cols, list(item))) for item in _data])
-            else:
-                # input data can be [1, 2, 3]
-                _table = pa.Table.from_pylist([dict(zip(_cols, [item])) for item in _data])
+            builder = _LOCAL_DATA_BUILDERS.get(type(_data[0]))
+            if builder is None:
+                # Subclasses such as namedtuples fall back to the first matching type.
+                builder = next(
+                    (b for t, b in _LOCAL_DATA_BUILDERS.items() if isinstance(_data[0], t)),
+                    _scalars_to_arrow,
+                )
+            _table = builder(_data, _cols, _schema)
 
         # Validate number of columns
         num_cols = _table.shape[1]
@@ -368,19 +379,10 @@ class SparkSession:
         numPartitions: Optional[int] = None,
     ) -> DataFrame:
         if end is None:
-            actual_end = start
-            start = 0
-        else:
-            actual_end = end
-
-        if numPartitions is not None:
-            numPartitions = int(numPartitions)
+            start, end = 0, start
 
         return DataFrame.withPlan(
-            Range(
-                start=int(start), end=int(actual_end), step=int(step), num_partitions=numPartitions
-            ),
-            self,
+            Range(start=start, end=end, step=step, num_partitions=numPartitions), self
         )
 
     range.__doc__ = PySparkSession.range.__doc__
@@ -523,9 +525,7 @@ class SparkSession:
 
             # Check if we're using unreleased version that is in development.
             # Also checks SPARK_TESTING for RC versions.
-            is_dev_mode = (
-                "dev" in LooseVersion(__version__).version or "SPARK_TESTING" in os.environ
-            )
+            is_dev_mode = "dev" in __version__ or "SPARK_TESTING" in os.environ
             origin_remote = os.environ.get("SPARK_REMOTE", None)
             try:
                 if origin_remote is not None:
@@ -583,6 +583,81 @@ class SparkSession:
             raise RuntimeError("There should not be an existing Spark Session or Spark Context.")
 
 
+def _nested_rows_to_dicts(obj: Any) -> Any:
+    """Turn the nested Rows into dicts, as 'Row.asDict(recursive=True)' does."""
+    if isinstance(obj, Row):
+        return obj.asDict(True)
+    elif isinstance(obj, list):
+        return [_nested_rows_to_dicts(o) for o in obj]
+    elif isinstance(obj, dict):
+        return dict((k, _nested_rows_to_dicts(v)) for k, v in obj.items())
+    else:
+        return obj
+
+
+def _rows_to_arrow(
+    data: List[Row], cols: List[str], schema: Optional[Union[AtomicType, StructType]]
+) -> "pa.Table":
+    fields = getattr(data[0], "__fields__", None)
+    if fields is None or any(
+        getattr(row, "__fields__", None) != fields for row in islice(data, 1, None)
+    ):
+        # The fields have to be matched by name row by row.
+        return pa.Table.from_pylist([row.asDict(recursive=True) for row in data])
+
+    # All Rows share the same fields, so project them column by column positionally
+    # instead of building a dict per Row.
+    arrays = []
+    for column in zip(*data):
+        if any(isinstance(v, (Row, list, dict)) for v in column):
+            arrays.append(pa.array([_nested_rows_to_dicts(v) for v in column]))
+        else:
+            arrays.append(pa.array(column))
+    return pa.Table.from_pydict(dict(zip(fields, arrays)))
+
+
+def _dicts_to_arrow(
+    data: List[Dict[str, Any]], cols: List[str], schema: Optional[Union[AtomicType, StructType]]
+) -> "pa.Table":
+    if isinstance(schema, StructType):
+        # The schema is given, so pick the values by the field names.
+        keys = schema.names
+    else:
+        # Respect the inferred schema, which sorts the keys of dictionaries in alphabetical
+        # order. The keys are sorted once instead of sorting every dictionary.
+        keys = sorted(data[0])
+    return pa.Table.from_pydict({key: pa.array([d.get(key) for d in data]) for key in keys})
+
+
+def _tuples_to_arrow(
+    data: List[Union[List[Any], Tuple[Any, ...]]],
+    cols: List[str],
+    schema: Optional[Union[AtomicType, StructType]],
+) -> "pa.Table":
+    # Transpose the rows into columns once instead of building a dict per row.
+    # Shorter rows are padded with nulls, and values beyond the columns are dropped.
+    return pa.Table.from_pydict(dict(zip(cols, (pa.array(c) for c in zip_longest(*data)))))
+
+
+def _scalars_to_arrow(
+    data: List[Any], cols: List[str], schema: Optional[Union[AtomicType, StructType]]
+) -> "pa.Table":
+    # input data can be [1, 2, 3]
+    return pa.Table.from_pydict({cols[0]: pa.array(data)})
+
+
+# Converters from a list of local data to an Arrow table, keyed by the type of the first
+# element. Row must come before tuple for the isinstance fallback on subclasses.
+_LOCAL_DATA_BUILDERS: Dict[
+    type, Callable[[List[Any], List[str], Optional[Union[AtomicType, StructType]]], "pa.Table"]
+] = {
+    Row: _rows_to_arrow,
+    dict: _dicts_to_arrow,
+    list: _tuples_to_arrow,
+    tuple: _tuples_to_arrow,
+}
+
+
 SparkSession.__doc__ = PySparkSession.__doc__
 
 
@@ -30,6 +30,7 @@ from pyspark.sql.types import (
     IntegerType,
     MapType,
     ArrayType,
+    TimestampNTZType,
     Row,
 )
 from pyspark.testing.utils import ReusedPySparkTestCase
@@ -477,6 +478,44 @@ class SparkConnectBasicTests(SparkConnectSQLTestCase):
             self.assertEqual(sdf.schema, cdf.schema)
             self.assert_eq(sdf.toPandas(), cdf.toPandas())
 
+        # Nested Rows and lists of Rows
+        data = [
+            Row(a=1, b=Row(c=2, d=[Row(e=1)])),
+            Row(a=2, b=Row(c=3, d=[Row(e=2), Row(e=3)])),
+        ]
+        sdf = self.spark.createDataFrame(data)
+        cdf = self.connect.createDataFrame(data)
+
+        self.assertEqual(sdf.schema, cdf.schema)
+        self.assertEqual(sdf.collect(), cdf.collect())
+
+    def test_with_local_rows_with_duplicate_names(self):
+        # Rows with duplicate field names, e.g., from a self join, must not be collapsed
+        # into a single column.
+        row = Row("a", "a")(1, 2)
+        self.assertEqual(
+            self.connect._inferSchemaFromList([row]),
+            StructType([StructField("a", LongType()), StructField("a", LongType())]),
+        )
+        with self.assertRaisesRegex(ValueError, "Length mismatch"):
+            self.connect.createDataFrame([row])
+
+    def test_with_local_dicts_and_schema(self):
+        # Dictionaries are matched to the given schema by field name.
+        data = [{"earnings": 10000, "course": "dotNET"}, {"course": "Java"}]
+        schema = StructType(
+            [
+                StructField("course", StringType(), True),
+                StructField("earnings", LongType(), True),
+            ]
+        )
+
+        sdf = self.spark.createDataFrame(data, schema=schema)
+        cdf = self.connect.createDataFrame(data, schema=schema)
+
+        self.assertEqual(sdf.schema, cdf.schema)
+        self.assert_eq(sdf.toPandas(), cdf.toPandas())
+
     def test_with_atom_type(self):
         for data in [[(1), (2), (3)], [1, 2, 3]]:
             for schema in ["long", "int", "short"]:
@@ -1100,6 +1139,73 @@ class SparkConnectBasicTests(SparkConnectSQLTestCase):
                 self.spark.createDataFrame(pdf).collect(),
             )
 
+    def test_create_dataframe_from_arrow(self):
+        from datetime import datetime
+        import pyarrow as pa
+
+        table = pa.table(
+            {
+                "a": [1, 2, None],
+                "b": ["x", None, "z"],
+                "ns": pa.array([1, 1001, None], type=pa.timestamp("ns")),
+                "ms": pa.array([1, 1001, None], type=pa.timestamp("ms")),
+            }
+        )
+        # Naive Arrow timestamps are sent as-is, and read back as timestamp_ntz.
+        schema = StructType(
+            [
+                StructField("a", LongType()),
+                StructField("b", StringType()),
+                StructField("ns", TimestampNTZType()),
+                StructField("ms", TimestampNTZType()),
+            ]
+        )
+        rows = [
+            Row(a=1, b="x", ns=datetime(1970, 1, 1), ms=datetime(1970, 1, 1, 0, 0, 0, 1000)),
+            Row(
+                a=2,
+                b=None,
+                ns=datetime(1970, 1, 1, 0, 0, 0, 1),
+                ms=datetime(1970, 1, 1, 0, 0, 1, 1000),
+            ),
+            Row(a=None, b="z", ns=None, ms=None),
+        ]
+
+        for data in [table, table.to_batches()[0]]:
+            cdf = self.connect.createDataFrame(data)
+            self.assertEqual(cdf.schema, schema)
+            self.assertEqual(cdf.collect(), rows)
+
+            cdf = self.connect.createDataFrame(data, schema=["w", "x", "y", "z"])
+            self.assertEqual(cdf.columns, ["w", "x", "y", "z"])
+            self.assertEqual(cdf.collect(), [tuple(row) for row in rows])
+
+        # The schema of an empty Arrow table is still known.
+        self.assertEqual(self.connect.createDataFrame(table.slice(0, 0)).schema, schema)
+
+        # Upcasting coarser timestamps to microseconds must not overflow silently.
+        with self.assertRaisesRegex(pa.ArrowInvalid, "out of bounds"):
+            self.connect.createDataFrame(
+                pa.table({"s": pa.array([10**15], type=pa.timestamp("s"))})
+            )
+
+    def test_create_dataframe_from_pandas_with_index(self):
+        """The pandas index should not be converted into a column."""
+        from datetime import datetime
+        import pandas as pd
+
+        for pdf in [
+            pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[10, 20]),
+            pd.DataFrame(
+                {"a": [1, 2], "ts": [datetime(2019, 1, 1), datetime(2020, 1, 1)]}, index=["x", "y"]
+            ),
+        ]:
+            cdf = self.connect.createDataFrame(pdf)
+            sdf = self.spark.createDataFrame(pdf)
+
+            self.assertEqual(cdf.columns, list(pdf.columns))
+            self.assertEqual(cdf.collect(), sdf.collect())
+
     def test_select_expr(self):
         # SPARK-41201: test selectExpr API.
         self.assert_eq(